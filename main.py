@@ -7,6 +7,7 @@ from os import path
 
 import threading
 import os
+import signal
 import sys
 
 APPLICATION_NAME = "fi-supporter"
@@ -71,33 +72,63 @@ def try_create_shortcut(app_path : str, create_desktop = False, create_startmenu
 
 """ Registry Manipulations"""
 
-from io import BufferedWriter, TextIOWrapper
-import winreg as reg
+from io import BufferedWriter
 
-current_user_key = reg.HKEY_CURRENT_USER
-all_users_key = reg.HKEY_LOCAL_MACHINE
 key_value = "Software\\Microsoft\\Windows\\CurrentVersion\\Run"
 
-def set_registry_key(path, reg_key_name, open):
-    reg.SetValueEx(open, reg_key_name, 0, reg.REG_SZ, path)
-
-def try_add_to_registry(path : str, reg_key_name : str, all_users : bool = False):
-    
-    key_category = (all_users_key if all_users else current_user_key)
-    key_type = reg.ConnectRegistry(None, key_category)
-    open = reg.OpenKey(key_type, key_value, 0, reg.KEY_ALL_ACCESS)
+def try_add_many_to_registry(entries : dict[str, str], all_users : bool = False):
+    """Reconcile several Run-key values under one read handle and, only when
+    something actually changed, one write handle."""
+    # Deferred so importing this module doesn't bind the registry DLL
+    # (and stays importable off Windows); cached after the first call.
+    import winreg as reg
+    key_category = (reg.HKEY_LOCAL_MACHINE if all_users else reg.HKEY_CURRENT_USER)
+    stale : dict[str, str] = {}
+    read_key = reg.OpenKey(key_category, key_value, 0, reg.KEY_QUERY_VALUE)
     try:
-        value, type = reg.QueryValueEx(open, reg_key_name)
-        if not (type == reg.REG_SZ and value == path):
-            set_registry_key(path, reg_key_name, open)
-    except FileNotFoundError:
-        set_registry_key(path, reg_key_name, open)
+        for reg_key_name, path in entries.items():
+            try:
+                value, type = reg.QueryValueEx(read_key, reg_key_name)
+                if not (type == reg.REG_SZ and value == path):
+                    stale[reg_key_name] = path
+            except FileNotFoundError:
+                stale[reg_key_name] = path
     finally:
-        reg.CloseKey(open)
+        reg.CloseKey(read_key)
+    if stale:
+        write_key = reg.OpenKey(key_category, key_value, 0, reg.KEY_SET_VALUE)
+        try:
+            for reg_key_name, path in stale.items():
+                reg.SetValueEx(write_key, reg_key_name, 0, reg.REG_SZ, path)
+        finally:
+            reg.CloseKey(write_key)
+
+def try_add_to_registry(path : str, reg_key_name : str, all_users : bool = False):
+    try_add_many_to_registry({reg_key_name: path}, all_users)
 
 """ Helpers """
 
+import bisect
+import functools
+import hashlib
 import json
+import pickle
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_decoder = json.JSONDecoder()
+
+if orjson is not None:
+    loads_json = orjson.loads
+else:
+    def loads_json(contents : bytes | str) -> Any:
+        if isinstance(contents, bytes):
+            contents = contents.decode('utf8')
+        value, _ = _json_decoder.raw_decode(contents.lstrip())
+        return value
 
 ERROR = "Error"
 WARNING = "Warning"
@@ -118,19 +149,72 @@ class NoLog(BufferedWriter):
         pass
     def write(self, data : bytes):
         pass
+    def flush(self):
+        pass
+    def close(self):
+        pass
+
+LOG_BUFFER_SIZE = 1 << 16
+LOG_FLUSH_INTERVAL = 0.1
+
+def start_log_flusher():
+    def _flusher():
+        while True:
+            time.sleep(LOG_FLUSH_INTERVAL)
+            log_flush()
+    flusher = threading.Thread(target=_flusher, name='log-flusher', daemon=True)
+    flusher.start()
+    drainer = threading.Thread(target=_log_drain, name='log-drain', daemon=True)
+    drainer.start()
+
+def _log_drain():
+    """Pulls queued messages and writes them in one batch per burst, keeping
+    print/log syscalls off the watchdog dispatch threads."""
+    while True:
+        message, end = _log_queue.get()
+        parts = [message + end]
+        try:
+            while True:
+                message, end = _log_queue.get_nowait()
+                parts.append(message + end)
+        except Empty:
+            pass
+        out = ''.join(parts)
+        print(out, end='')
+        log(out)
+
+def _log_queue_settle(timeout : float = 1.0):
+    """Best-effort wait for queued messages to reach the log buffer."""
+    deadline = time.monotonic() + timeout
+    while not _log_queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+from queue import Empty, SimpleQueue
+
+# Watcher drain threads, the flusher and main all hit the same buffer.
+_log_lock = threading.Lock()
+
+_log_queue : SimpleQueue = SimpleQueue()
+
+def log_flush():
+    try:
+        with _log_lock:
+            log_file.flush()
+    except Exception as err:
+        print(err)
 
 def log(msg : str):
     try:
         if not msg.endswith(os.linesep):
             msg += os.linesep
-        log_file.write(msg.encode('utf8'))
+        data = msg.encode('utf8')
+        with _log_lock:
+            log_file.write(data)
     except Exception as err:
         print(err)
 
 def notify_message(message : str | Exception, end=os.linesep):
-    message = str(message)
-    print(message, end=end)
-    log(message)
+    _log_queue.put((str(message), end))
 
 def notify_event(message : str, category : str, type : str):
     msg = f"{type}: {category}. {message}{os.linesep}"
@@ -138,82 +222,133 @@ def notify_event(message : str, category : str, type : str):
 
 def raise_error(message : str, category : str):
     notify_event(message, category, ERROR)
+    _log_queue_settle()
+    log_flush()
     raise Exception(message)
 
 def raise_warning(message : str, category : str):
     notify_event(message, category, WARNING)
 
-def get_path_if_exists(file_path : str) -> str | None:
-    if file_path and path.exists(file_path):
-        return file_path
-    else:
-        raise_warning(f"Can't find the path '{file_path}'", INVALID_CONFIG_CAT)
-        return None
+@functools.lru_cache(maxsize=4096)
+def _stat_exists(norm_path : str) -> bool:
+    try:
+        os.stat(norm_path)
+    except OSError:
+        return False
+    return True
+
+def _resolve_existing(file_path : str) -> str | None:
+    """One stat per distinct path: None when missing, the absolute path otherwise.
+    The cache key is case-normalized so spelling variants of one path share
+    a single stat."""
+    abs_path = path.abspath(file_path)
+    return abs_path if _stat_exists(os.path.normcase(abs_path)) else None
+
+def _scan_names(parent : str) -> set[str]:
+    # Case-normalized: the membership probe must not be stricter than the
+    # case-insensitive filesystem it stands in for.
+    try:
+        with os.scandir(parent) as it:
+            return {os.path.normcase(entry.name) for entry in it}
+    except OSError:
+        return set()
 
 def get_existent_paths(paths : list[str]) -> Iterator[str]:
+    # Configured paths are often siblings; one scandir per parent replaces
+    # a stat per path. Distinct parents are scanned concurrently, since on
+    # network shares each listing is a full round-trip.
+    entries : list[tuple[str, str, str, str]] = []
+    parents : set[str] = set()
     for one_path in paths:
-        existent_path = get_path_if_exists(one_path)
+        abs_path = parent = name = ''
+        if one_path:
+            abs_path = path.abspath(one_path)
+            parent, name = os.path.split(abs_path)
+            if name and parent != abs_path:
+                parents.add(parent)
+        entries.append((one_path, abs_path, parent, name))
+
+    if len(parents) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(parents))) as pool:
+            names_by_parent = dict(zip(parents, pool.map(_scan_names, parents)))
+    else:
+        names_by_parent = {parent: _scan_names(parent) for parent in parents}
+
+    for one_path, abs_path, parent, name in entries:
+        existent_path = None
+        if one_path:
+            if name and parent != abs_path:
+                existent_path = abs_path if os.path.normcase(name) in names_by_parent[parent] else None
+            else:
+                existent_path = _resolve_existing(one_path)
         if existent_path:
-            yield path.abspath(str(existent_path))
+            yield existent_path
+        else:
+            raise_warning(f"Can't find the path '{one_path}'", INVALID_CONFIG_CAT)
 
 
-class CustomJsonEncoder(json.JSONEncoder):
-    def default(self, o : Any) -> Any:
-        if type(o).__name__ == 'Configuration' or type(o).__name__ == 'Include' or type(o).__name__ == 'Exclude':
-            return o.__dict__
-        else:
-            return json.JSONEncoder.default(self, o)
+def encode_rule(o : Any) -> Any:
+    if isinstance(o, (Configuration, Include)):
+        return {key: getattr(o, key) for key in o.__slots__ if not key.startswith('_')}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
 def print_configuration(config):
-    s = json.dumps(config, cls=CustomJsonEncoder, indent=4)
-    print("\nConfiguration: \n" + s)
+    if orjson is not None:
+        s = orjson.dumps(config, default=encode_rule, option=orjson.OPT_INDENT_2).decode()
+    else:
+        s = json.dumps(config, default=encode_rule, indent=4)
+    print("\nConfiguration: ", s, sep="\n")
 
 """ Configuration Part """
 
-INCLUDES = 'includes'
-EXCLUDES = 'excludes'
-PATHS = 'paths'
-TARGET_PATH = 'targetPath'
+# Interned so dict probes in the parse loop hit the pointer-equality fast path.
+INCLUDES = sys.intern('includes')
+EXCLUDES = sys.intern('excludes')
+PATHS = sys.intern('paths')
+TARGET_PATH = sys.intern('targetPath')
 
 class ConfigurationRule:
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor : ConfigurationVisitor):
         pass
 
 class Include(ConfigurationRule):
+    __slots__ = ('is_active', 'include_paths', 'target_path', 'excludes',
+                 '_drive', '_include_prefixes', '_ignore_patterns_cache')
+
     is_active : bool
     include_paths : list[str]
     target_path : str
     excludes : list[str]
+    _drive : str
+    _include_prefixes : tuple[str, ...]
+    _ignore_patterns_cache : list[str] | None
 
     def __init__(self, includes : list[str], target_path : str, excludes : list[str]) -> None:
         self.is_active = True
         self.include_paths = includes
         self.target_path = target_path
         self.excludes = excludes
+        self._drive, _ = os.path.splitdrive(target_path)
+        self._include_prefixes = tuple(include_path + os.sep for include_path in includes)
+        self._ignore_patterns_cache = None
 
     @staticmethod
     def from_object(obj : dict) -> Include:
-        paths_obj : list[str] = obj.get(PATHS) 
-        paths : list[str] = list(paths_obj)
-        if not paths or not len(paths):
-            raise_error(NO_INCLUDE_PATHS_ERROR, INVALID_CONFIG_CAT)
-        
-        paths = list(get_existent_paths(paths))
-
-        if not len(paths):
+        get = obj.get
+        paths : list[str] = list(get_existent_paths(get(PATHS) or ()))
+        if not paths:
             raise_error(NO_INCLUDE_PATHS_ERROR, INVALID_CONFIG_CAT)
-        
-        target_path = path.abspath(str(obj.get(TARGET_PATH)))
 
-        if not target_path:
+        target_obj = get(TARGET_PATH)
+        if not target_obj:
             raise_error(f"'{TARGET_PATH}' is unspecified", INVALID_CONFIG_CAT)
-        
-        excludes = obj.get(EXCLUDES)
-        if excludes and len(excludes):
-            excludes = list(get_existent_paths(excludes))
-        else:
-            excludes = []
+        target_path = path.abspath(target_obj)
+
+        excludes_obj = get(EXCLUDES)
+        excludes = list(get_existent_paths(excludes_obj)) if excludes_obj else []
 
         return Include(paths, target_path, excludes)
     
@@ -222,46 +357,43 @@ class Include(ConfigurationRule):
         if self.excludes:
             for exclude in list(self.excludes):
                 visitor.visit_exclude(exclude)
-    
+
     def __repr__(self) -> str:
-        return str(self.__dict__)
+        return str({key: getattr(self, key) for key in self.__slots__})
 
 class Configuration(ConfigurationRule):
+    __slots__ = ('includes',)
 
     includes : list[Include]
-    
+
     def __init__(self, includes : list[Include]):
         self.includes = includes
     
     @staticmethod
     def parse_includes(obj : dict) -> list[Include] | None:
         includes_obj = obj.get(INCLUDES)
-        if includes_obj and len(includes_obj):
-            includes : list[Include] = list();
+        if includes_obj:
+            includes : list[Include] = []
             for include_obj in includes_obj:
                 if include_obj:
                     include = Include.from_object(include_obj)
                     if include:
                         includes.append(include)
-            if (len(includes)):
+            if includes:
                 return includes
         return None
 
     @staticmethod
     def from_object(obj : dict) -> Configuration:
         includes = Configuration.parse_includes(obj)
-        if includes and len(includes):
+        if includes:
             return Configuration(includes)
         else:
             raise_error("No includes specified", INVALID_CONFIG_CAT)
 
     @staticmethod
-    def from_string(contents : str) -> Configuration:
-        return Configuration.from_object(json.loads(contents))
-
-    @staticmethod
-    def from_file(fi : TextIOWrapper) -> Configuration:
-        return Configuration.from_string(fi.read())
+    def from_string(contents : bytes | str) -> Configuration:
+        return Configuration.from_object(loads_json(contents))
 
     def accept(self, visitor : ConfigurationVisitor):
         visitor.visit_configuration(self)
@@ -269,10 +401,11 @@ class Configuration(ConfigurationRule):
             include.accept(visitor)
 
     def __repr__(self) -> str:
-        return str(self.__dict__)
+        return str({key: getattr(self, key) for key in self.__slots__})
     
 
 CONFIG_FILE_NAME = "config.json"
+CONFIG_CACHE_FILE_NAME = CONFIG_FILE_NAME + ".cache"
 CONFIG_TEMPLATE = """{
     "includes" : [
         {
@@ -286,20 +419,60 @@ CONFIG_TEMPLATE = """{
         }
     ]
 }"""
+_CONFIG_TEMPLATE_BYTES = CONFIG_TEMPLATE.encode('utf8')
+
+def _config_cache_key(contents : bytes) -> str:
+    return hashlib.blake2b(contents, digest_size=16).hexdigest()
+
+def try_load_cached_config(cache_file : str) -> dict | None:
+    if not path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, 'rb') as fi:
+            return pickle.load(fi)
+    except Exception:
+        return None
+
+def try_store_cached_config(cache_file : str, key : str, mtime_ns : int, config : Configuration):
+    try:
+        with open(cache_file, 'wb') as fo:
+            pickle.dump({'key': key, 'mtime_ns': mtime_ns, 'config': config}, fo)
+    except OSError as os_err:
+        raise_warning(f"Can't write the configuration cache '{cache_file}' :: {str(os_err)}", FS_ERROR_CAT)
 
 def try_read_config(appFolder : str) -> Configuration :
     try:
         config_file = os.path.join(appFolder, CONFIG_FILE_NAME)
         print("Configuration path: ", config_file)
         if path.exists(config_file):
-            with open(config_file, 'r') as config_file:
-                return Configuration.from_file(config_file)
+            cache_file = os.path.join(appFolder, CONFIG_CACHE_FILE_NAME)
+            cached = try_load_cached_config(cache_file)
+            mtime_ns = os.stat(config_file).st_mtime_ns
+            if cached and cached.get('mtime_ns') == mtime_ns:
+                return cached['config']
+            with open(config_file, 'rb', buffering=1 << 16) as fi:
+                contents = fi.read()
+            key = _config_cache_key(contents)
+            if cached and cached.get('key') == key:
+                # Touched but unchanged; refresh the recorded mtime only.
+                try_store_cached_config(cache_file, key, mtime_ns, cached['config'])
+                return cached['config']
+            config = Configuration.from_string(contents)
+            try_store_cached_config(cache_file, key, mtime_ns, config)
+            return config
         else:
-            with open(config_file, 'w') as config_file:
-                config_file.write(CONFIG_TEMPLATE)
-                raise_error("Created config. Modify the configuration file and restart the application after that", INVALID_CONFIG_CAT)
+            # Write the template to a sibling file and move it into place, so
+            # an interrupted first run can't leave a half-written config.
+            tmp_file = config_file + '.tmp'
+            with open(tmp_file, 'wb') as fo:
+                fo.write(_CONFIG_TEMPLATE_BYTES)
+            os.replace(tmp_file, config_file)
+            raise_error("Created config. Modify the configuration file and restart the application after that", INVALID_CONFIG_CAT)
     except OSError as osErr:
         raise_error(str(osErr), FS_ERROR_CAT)
+    finally:
+        # Paths are only immutable within a single load; don't let results go stale.
+        _stat_exists.cache_clear()
 
 
 """ Configuration Manipulations """
@@ -319,42 +492,97 @@ class ConfigurationVisitor:
 
 class ConfigurationValidationVisitor(ConfigurationVisitor):
     parent_include : Include
+    _sorted_prefixes : list[str]
+    _prefix_tuple : tuple[str, ...]
 
-    def __init__(self) -> None:
-        super().__init__()
-
-    def visit_configuration(self, config : Configuration) -> None:
-        super().visit_configuration(config)
-    
     def visit_include(self, include : Include) -> None:
         self.parent_include = include
-        super().visit_include(include)
-    
+        self._sorted_prefixes = sorted(os.path.normcase(prefix)
+                                       for prefix in include._include_prefixes)
+        self._prefix_tuple = tuple(self._sorted_prefixes)
+
     def visit_exclude(self, exclude : str) -> None:
-        # Check whether exclude paths are subpaths of include paths:
-        is_sub = False
-        for include_path in self.parent_include.include_paths:
-            if exclude.startswith(include_path):
-                is_sub = True
+        # Check whether exclude paths are subpaths of include paths; the
+        # lexicographic predecessor is the usual candidate prefix, but with
+        # nested include paths a sibling subtree can sort between an
+        # ancestor and the exclude, so a miss still needs the full scan.
+        # Compare case-normalized, since the filesystem is case-insensitive.
+        exclude_nc = os.path.normcase(exclude)
+        i = bisect.bisect_right(self._sorted_prefixes, exclude_nc) - 1
+        is_sub = i >= 0 and exclude_nc.startswith(self._sorted_prefixes[i])
+        if not is_sub:
+            is_sub = exclude_nc.startswith(self._prefix_tuple)
         if not is_sub:
             raise_warning(f'Exclude path "{exclude}" is not a subfolder of any "{self.parent_include.include_paths}"', INVALID_CONFIG_CAT)
             self.parent_include.excludes.remove(exclude)
-        super().visit_exclude(exclude)
+            self.parent_include._ignore_patterns_cache = None
+
+class CompositeVisitor(ConfigurationVisitor):
+    """Applies several visitors during a single configuration traversal."""
+
+    visitors : list[ConfigurationVisitor]
+
+    def __init__(self, visitors : list[ConfigurationVisitor]) -> None:
+        self.visitors = visitors
+        super().__init__()
+
+    def visit_configuration(self, config : Configuration) -> None:
+        for visitor in self.visitors:
+            visitor.visit_configuration(config)
+
+    def visit_include(self, include : Include) -> None:
+        for visitor in self.visitors:
+            visitor.visit_include(include)
+
+    def visit_exclude(self, exclude : str) -> None:
+        for visitor in self.visitors:
+            visitor.visit_exclude(exclude)
 
 class ConfigurationUpdateActiveDrivesVisitor(ConfigurationVisitor):
 
     activated_rules : list[Include]
     deactivated_rules : list[Include]
+    _drives_mask : int | None
+    _exists_cache : dict[str, bool]
 
     def __init__(self) -> None:
         self.activated_rules = []
         self.deactivated_rules = []
+        self._drives_mask = None
+        self._exists_cache = {}
         super().__init__()
 
+    def _prepare(self) -> None:
+        # One GetLogicalDrives syscall covers every include in this pass.
+        if sys.platform == 'win32':
+            self._drives_mask = _kernel32.GetLogicalDrives()
+        self._exists_cache.clear()
+
+    def visit_configuration(self, config : Configuration) -> None:
+        self._prepare()
+
+    def _drive_present(self, drive : str) -> bool:
+        # The bitmask only answers for drive letters; UNC roots such as
+        # \\server\share from splitdrive must go through a real existence
+        # check or they'd read as permanently absent.
+        if self._drives_mask is not None and len(drive) == 2 and drive[1] == ':':
+            return bool((self._drives_mask >> (ord(drive[0].upper()) - ord('A'))) & 1)
+        present = self._exists_cache.get(drive)
+        if present is None:
+            present = self._exists_cache[drive] = os.path.exists(drive)
+        return present
+
+    def update(self, includes : list[Include]) -> None:
+        """Flat fast path for device-change events: same effect as a full
+        config.accept traversal, without the per-include double dispatch."""
+        self._prepare()
+        for include in includes:
+            self.visit_include(include)
+
     def visit_include(self, include: Include) -> None:
         was_active = include.is_active
-        drive, _ = os.path.splitdrive(include.target_path)
-        include.is_active = os.path.exists(drive)
+        drive = include._drive
+        include.is_active = self._drive_present(drive)
         if was_active ^ include.is_active:
             if include.is_active:
                 self.activated_rules.append(include)
@@ -362,11 +590,9 @@ class ConfigurationUpdateActiveDrivesVisitor(ConfigurationVisitor):
             else:
                 self.deactivated_rules.append(include)
                 notify_message(f"Rule for target path: '{include.target_path}' is deactivated because the drive '{drive}' does not exists. Once the device is plugged in, the corresponding rule will be activated.")
-        return super().visit_include(include)
 
 """ Periodical attempts to execute unsuccessful synchronizions """
 
-from threading import Timer
 import datetime
 
 class AttemptOperation:
@@ -384,68 +610,56 @@ class AttemptOperation:
             return False
 
 class AttemptsManager:
-    _timer : Timer | None;
     _period : float
-    _operations : list[AttemptOperation]
+    _operations : dict[int, AttemptOperation]
+    _lock : threading.Lock
+    _wake : threading.Event
+    _worker : threading.Thread | None
     _has_started : bool
 
     def __init__(self, time_delta : datetime.timedelta = datetime.timedelta(minutes=1)) -> None:
         self._period = time_delta.seconds
-        self._operations = []
+        self._operations = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker = None
         self._has_started = False
-        self._timer = None
-        self.reset_timer()
-
-    def reset_timer(self) -> Timer:
-        if self._timer == None:
-            self._timer = Timer(self._period, self.inquire)
-        self._timer.name = self.__class__.__name__
-        self._timer.daemon = True
-        return self._timer
 
     def queue_operation(self, operation : AttemptOperation):
-        if self._has_started:
-            self.stop()
-            self._operations.append(operation)
-            self.start()
-        else:
-            self._operations.append(operation)
-    
+        with self._lock:
+            self._operations[id(operation)] = operation
+        self._wake.set()
+
     def queue_callable(self, callback : Callable[[], None], msg : str = "Operation has been queued"):
         notify_message(msg)
         self.queue_operation(AttemptOperation(callback))
 
-    def dequeue(self, operations : list[AttemptOperation]):
-        if self._has_started:
-            self.stop()
-            for op in operations:
-                self._operations.remove(op)
-            self.start()
-        else:
-            for op in operations:
-                self._operations.remove(op)
-
     def start(self):
+        if self._has_started:
+            return
         self._has_started = True
-        self.reset_timer().start()
+        self._worker = threading.Thread(target=self._loop, name=self.__class__.__name__, daemon=True)
+        self._worker.start()
 
     def stop(self):
         self._has_started = False
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
+        self._wake.set()
 
-    def inquire(self):
-        operations_to_remove : list[AttemptOperation] = []
-        for op in self._operations:
-            if op.try_execute():
-                operations_to_remove.append(op)
-        if len(operations_to_remove):
-            self.dequeue(operations_to_remove)
+    def _loop(self):
+        while self._has_started:
+            self._wake.wait(self._period)
+            self._wake.clear()
+            if self._has_started:
+                self.inquire()
 
-        self.stop()
-        if len(self._operations):
-            self.start()
+    def inquire(self):
+        with self._lock:
+            pending = list(self._operations.items())
+        executed = [key for key, op in pending if op.try_execute()]
+        if executed:
+            with self._lock:
+                for key in executed:
+                    self._operations.pop(key, None)
 
 attempts_manager : AttemptsManager = AttemptsManager()
 
@@ -453,159 +667,309 @@ attempts_manager : AttemptsManager = AttemptsManager()
 
 try:
     from watchdog.observers import Observer
-    from watchdog.events import FileSystemEvent, FileSystemEventHandler, FileSystemMovedEvent, PatternMatchingEventHandler
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
 except:
     os.system('pip install watchdog')
     from watchdog.observers import Observer
-    from watchdog.events import FileSystemEvent, FileSystemEventHandler, FileSystemMovedEvent, PatternMatchingEventHandler
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
 
+import fnmatch
+import re
 import shutil
-import filecmp
+import stat
+import time
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+def _file_digest(file_path : str) -> bytes:
+    digest = _blake3() if _blake3 else hashlib.blake2b()
+    with open(file_path, 'rb') as fi:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fi.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        for chunk in iter(lambda: fi.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+@functools.lru_cache(maxsize=4096)
+def _cached_digest(file_path : str, mtime_ns : int, size : int) -> bytes:
+    return _file_digest(file_path)
+
+_COMPARE_BUFFER_SIZE = 128 * 1024
+
+def _contents_equal(src : str, dst : str) -> bool:
+    with open(src, 'rb', buffering=_COMPARE_BUFFER_SIZE) as fsrc, \
+         open(dst, 'rb', buffering=_COMPARE_BUFFER_SIZE) as fdst:
+        while True:
+            src_chunk = fsrc.read(_COMPARE_BUFFER_SIZE)
+            if src_chunk != fdst.read(_COMPARE_BUFFER_SIZE):
+                return False
+            if not src_chunk:
+                return True
+
+def files_equal(src : str, dst : str, src_stat : os.stat_result | None = None, dst_stat : os.stat_result | None = None) -> bool:
+    src_stat = src_stat or os.stat(src)
+    dst_stat = dst_stat or os.stat(dst)
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    # Small files: one early-exit buffer compare beats hashing both sides.
+    # Large files: hash so the cached digest pays off across repeated events.
+    if src_stat.st_size <= _HASH_CHUNK_SIZE:
+        return _contents_equal(src, dst)
+    return (_cached_digest(src, src_stat.st_mtime_ns, src_stat.st_size)
+            == _cached_digest(dst, dst_stat.st_mtime_ns, dst_stat.st_size))
+
+_created_folders = threading.local()
 
 def ensure_parent_folder_exists(dst : str):
-    folder, _ = os.path.split(dst)
-    if not os.path.exists(folder):
-        ensure_parent_folder_exists(folder)
-        os.mkdir(folder)
+    """Create all missing ancestors of dst in one makedirs call, skipping
+    folders this thread has already created."""
+    folder = os.path.dirname(dst)
+    if not folder:
+        return
+    created : set[str] | None = getattr(_created_folders, 'paths', None)
+    if created is None:
+        created = _created_folders.paths = set()
+    if folder in created:
+        return
+    os.makedirs(folder, exist_ok=True)
+    created.add(folder)
+
+def forget_created_folders(prefix : str):
+    """Evict a deleted subtree from this thread's created-folder cache."""
+    created : set[str] | None = getattr(_created_folders, 'paths', None)
+    if created:
+        _created_folders.paths = {folder for folder in created if not folder.startswith(prefix)}
+
+import ctypes
+
+_kernel32 = ctypes.windll.kernel32 if sys.platform == 'win32' else None
+
+if sys.platform == 'win32':
+    from ctypes import wintypes
+    _copy_file_ex = _kernel32.CopyFileExW
+    _copy_file_ex.restype = wintypes.BOOL
+    _copy_file_ex.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p,
+                              ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD)
+else:
+    _copy_file_ex = None
+
+def _copy_file_contents(src : str, dst : str):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        if hasattr(os, 'copy_file_range'):
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not copied:
+                    break
+                remaining -= copied
+        elif hasattr(os, 'sendfile'):
+            # Older kernels without copy_file_range: sendfile still moves
+            # pages kernel-to-kernel instead of through Python buffers.
+            offset = 0
+            while remaining > 0:
+                copied = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if not copied:
+                    break
+                offset += copied
+                remaining -= copied
+        else:
+            shutil.copyfileobj(fsrc, fdst)
 
 def copy_method(src, dst):
     ensure_parent_folder_exists(dst)
-    return shutil.copy2(src, dst)
+    if _copy_file_ex:
+        # CopyFileExW preserves timestamps itself; no extra stat/utime pass.
+        if not _copy_file_ex(src, dst, None, None, None, 0):
+            raise ctypes.WinError()
+    else:
+        _copy_file_contents(src, dst)
+        src_stat = os.stat(src)
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return dst
+
+EVENT_BATCH_WINDOW = 0.25
+
+_shared_observer : Observer | None = None
+_shared_observer_lock = threading.Lock()
+
+def get_shared_observer() -> Observer:
+    """One Observer (one ReadDirectoryChangesW thread) serves every Watcher."""
+    global _shared_observer
+    with _shared_observer_lock:
+        if _shared_observer is None:
+            _shared_observer = Observer()
+            _shared_observer.name = 'fs-observer'
+            _shared_observer.daemon = True
+        return _shared_observer
 
 class Watcher:
+    __slots__ = ('source_path', 'base_target_path', 'source_folder_name',
+                 'ignore_paths', '_ignore_prefixes', '_ignore_exact', '_watch', 'handler',
+                 '_events', '_worker', '_src_prefix_len', '_target_path',
+                 '_target_base')
+
     source_path : str
     base_target_path : str
     source_folder_name : str
     ignore_paths : list[str]
-    observer : Observer
+    _ignore_prefixes : tuple[str, ...]
     handler : FileSystemEventHandler
+    _events : SimpleQueue
+    _worker : threading.Thread | None
 
     def __init__(self, src : str, base_target_path : str, source_folder_name : str) -> None:
-        self.source_path = src
-        self.base_target_path = base_target_path
+        # Interned paths hit the identity fast path in later dict/set lookups.
+        self.source_path = sys.intern(src)
+        self.base_target_path = sys.intern(base_target_path)
         self.source_folder_name = source_folder_name
-        self.observer = Observer()
-    
+        self._watch = None
+        self.handler = None
+        self._events = SimpleQueue()
+        self._worker = None
+        self._src_prefix_len = len(src) + len(os.sep)
+        self._target_path = os.path.join(base_target_path, source_folder_name)
+        self._target_base = self._target_path + os.sep
+
     def configure_observer(self, ignore_patterns : Any = []):
         self.ignore_paths = ignore_patterns
-        _, file_name = os.path.split(self.source_path)
-        self.observer.name = f'observer-{file_name}'
-        self.handler = PatternMatchingEventHandler(
-            "*", ignore_patterns, ignore_directories=False, case_sensitive=True)
-        self.handler.on_created = self.on_created
-        self.handler.on_deleted = self.on_deleted
-        self.handler.on_modified = self.on_modified
-        self.handler.on_moved = self.on_moved
+        ignored_roots = [sys.intern(os.path.join(self.source_path, ignore_path))
+                         for ignore_path in ignore_patterns]
+        # Separator-terminated prefixes so 'build' doesn't swallow 'build2';
+        # the roots themselves are matched exactly.
+        self._ignore_exact = frozenset(ignored_roots)
+        self._ignore_prefixes = tuple(root + os.sep for root in ignored_roots)
+        # The ignore list is plain path prefixes, checked inline in _dispatch;
+        # the generic pattern-matching handler would fnmatch every event for
+        # nothing, and routing through watchdog's dispatch would add an
+        # on_any_event call plus a method lookup per event.
+        self.handler = FileSystemEventHandler()
+        self.handler.dispatch = self._dispatch
     
     def run(self):
         if self.handler == None:
             self.configure_observer()
-        try:
-            self.observer.schedule(self.handler, self.source_path, recursive=True)
-            self.observer.start()
-        except Exception as ex:
-            raise ex
+        observer = get_shared_observer()
+        self._watch = observer.schedule(self.handler, self.source_path, recursive=True)
+        if not observer.is_alive():
+            observer.start()
+        self._worker = threading.Thread(target=self._drain, name=f'worker-{self.source_folder_name}', daemon=True)
+        self._worker.start()
 
     def stop(self):
-        self.observer.stop()
-        self.observer.join()
+        if self._watch:
+            get_shared_observer().unschedule(self._watch)
+            self._watch = None
 
     def _should_ignore(self, path : str) -> bool:
-        for ignore_path in self.ignore_paths: 
-            if path.startswith(os.path.join(self.source_path, ignore_path)):
-                return True
-        return False
-
-    @property
-    def target_path(self):
-        return os.path.join(self.base_target_path, self.source_folder_name)
+        return path in self._ignore_exact or path.startswith(self._ignore_prefixes)
 
     def _destination_path(self, from_path : str):
-        tail_subpath = from_path.removeprefix(self.source_path).removeprefix(os.sep)
-        return path.join(self.target_path, tail_subpath)
+        return self._target_base + from_path[self._src_prefix_len:]
     
     def _copy_item(self, src_path : str) -> str:
         destination = self._destination_path(src_path)
         return copy_method(src_path, destination)
     
-    def _create(self, src_path):
-        if os.path.isfile(src_path):
-            destination = self._copy_item(src_path)
-        else:
+    def _create(self, src_path, is_dir : bool):
+        if is_dir:
             destination = self._destination_path(src_path)
             os.mkdir(destination)
+        else:
+            destination = self._copy_item(src_path)
         notify_message(f"{destination} has been created!")
-    
-    def on_created(self, event : FileSystemEvent):
+
+    def _dispatch(self, event : FileSystemEvent):
+        kind = event.event_type
+        if kind == 'modified':
+            if event.is_directory:
+                return
+        elif kind not in ('created', 'deleted', 'moved'):
+            return
         src_path = str(event.src_path)
         if self._should_ignore(src_path):
             return
+        dest_path = str(event.dest_path) if kind == 'moved' else None
+        # Deletions can't be classified by the emitter (the path is already
+        # gone, so Windows reports them all as file events); let _delete
+        # decide from the mirrored destination instead.
+        is_dir = None if kind == 'deleted' else event.is_directory
+        self._events.put((kind, src_path, dest_path, is_dir))
+
+    def _handle_created(self, src_path : str, is_dir : bool):
         try:
-            self._create(src_path)
+            self._create(src_path, is_dir)
         except PermissionError as permissionErr:
-            attempts_manager.queue_callable(lambda : self._create(src_path), f"Creation of {self._destination_path(src_path)} operation has been queued")
-            attempts_manager.start()
+            self._queue_retry('Creation', self._destination_path(src_path), self._create, src_path, is_dir)
         except OSError as os_err:
             notify_event(str(os_err), MONITOR_CAT, ERROR)
 
-    def _delete(self, destination):
-        if os.path.isfile(destination):
-            os.remove(destination)
-        else:
+    def _delete(self, destination, is_dir : bool | None = None):
+        if is_dir is None:
+            is_dir = not os.path.isfile(destination)
+        if is_dir:
             shutil.rmtree(destination)
+            forget_created_folders(destination)
+        else:
+            os.remove(destination)
         notify_message(f"{destination} has been deleted!")
-    
-    def on_deleted(self, event : FileSystemEvent):
-        src_path = str(event.src_path)
-        if self._should_ignore(src_path):
-            return
+
+    def _handle_deleted(self, src_path : str, is_dir : bool | None):
         destination = self._destination_path(src_path)
         try:
-            self._delete(destination)
+            self._delete(destination, is_dir)
         except PermissionError as permissionErr:
-            attempts_manager.queue_callable(lambda : self._delete(destination), f"Deletion of {self._destination_path(destination)} operation has been queued")
-            attempts_manager.start()
+            self._queue_retry('Deletion', destination, self._delete, destination, is_dir)
         except OSError as os_err:
             notify_event(str(os_err), MONITOR_CAT, ERROR)
 
     def _replace(self, src_path):
-        if os.path.isfile(src_path):
-            dst = self._destination_path(src_path)
-            if not os.path.exists(dst) or not filecmp.cmp(src_path, dst):
-                destination = copy_method(src_path, dst)
-                notify_message(f"{destination} has been replaced!")
-    
-    def on_modified(self, event : FileSystemEvent):
-        src_path = str(event.src_path)
-        if self._should_ignore(src_path):
+        try:
+            src_stat = os.stat(src_path)
+        except OSError:
+            return
+        if not stat.S_ISREG(src_stat.st_mode):
             return
+        dst = self._destination_path(src_path)
+        try:
+            dst_stat = os.stat(dst)
+        except OSError:
+            dst_stat = None
+        if dst_stat is None or not files_equal(src_path, dst, src_stat=src_stat, dst_stat=dst_stat):
+            destination = copy_method(src_path, dst)
+            notify_message(f"{destination} has been replaced!")
+    
+    def _handle_modified(self, src_path : str):
         try:
             self._replace(src_path)
         except PermissionError as permission_err:
-            attempts_manager.queue_callable(lambda : self._replace(src_path), f"Replacement of {self._destination_path(src_path)} operation has been queued")
-            attempts_manager.start()
+            self._queue_retry('Replacement', self._destination_path(src_path), self._replace, src_path)
         except OSError as os_err:
             notify_event(str(os_err), MONITOR_CAT, ERROR)
 
+    def _queue_retry(self, action : str, target : str, fn, *args):
+        # functools.partial is a C type; cheaper than a fresh lambda per failure.
+        attempts_manager.queue_callable(functools.partial(fn, *args), "{0} of {1} operation has been queued".format(action, target))
+        attempts_manager.start()
+
     def nameIsDifferent(self, src_path, dest_path) -> bool:
-        _, src_name = os.path.split(src_path)
-        _, dst_name = os.path.split(dest_path)
-        return src_name != dst_name
+        return os.path.basename(src_path) != os.path.basename(dest_path)
 
-    def on_moved(self, event : FileSystemMovedEvent):
-        src_path = str(event.src_path)
-        if self._should_ignore(src_path):
-            return
-        target_source_path = self._destination_path(src_path) 
-        dest_path = str(event.dest_path)
+    def _handle_moved(self, src_path : str, dest_path : str):
+        target_source_path = self._destination_path(src_path)
         target_dest_path = self._destination_path(dest_path)
 
         if path.exists(target_source_path) and self.nameIsDifferent(src_path, dest_path):
             try:
                 self._rename(target_source_path, target_dest_path)
             except PermissionError as permission_err:
-                attempts_manager.queue_callable(lambda : self._rename(target_source_path, target_dest_path), f"Renaming of {target_source_path} operation has been queued")
-                attempts_manager.start()
+                self._queue_retry('Renaming', target_source_path, self._rename, target_source_path, target_dest_path)
             except OSError as osErr:
                 notify_event(str(osErr), MONITOR_CAT, ERROR)
 
@@ -615,51 +979,198 @@ class Watcher:
         os.rename(target_source_path, target_dest_path)
         notify_message(f"{target_source_path} has been moved to {target_dest_path}!")
 
+    def _collect_batch(self) -> dict[tuple[str, str], tuple[str, str, str | None, bool]]:
+        # Hot loop: bind lookups to locals once instead of per iteration.
+        get = self._events.get
+        monotonic = time.monotonic
+        batch : dict[tuple[str, str], tuple[str, str, str | None, bool]] = {}
+        event = get()
+        batch[event[:2]] = event
+        deadline = monotonic() + EVENT_BATCH_WINDOW
+        while True:
+            timeout = deadline - monotonic()
+            if timeout <= 0:
+                break
+            try:
+                event = get(timeout=timeout)
+            except Empty:
+                break
+            batch[event[:2]] = event
+        # A creation already copies the content; drop modify events it supersedes.
+        for kind, src_path in list(batch):
+            if kind == 'modified' and ('created', src_path) in batch:
+                del batch[(kind, src_path)]
+        return batch
+
+    def _drain(self):
+        while True:
+            for kind, src_path, dest_path, is_dir in self._collect_batch().values():
+                if kind == 'created':
+                    self._handle_created(src_path, is_dir)
+                elif kind == 'deleted':
+                    self._handle_deleted(src_path, is_dir)
+                elif kind == 'modified':
+                    self._handle_modified(src_path)
+                elif kind == 'moved':
+                    self._handle_moved(src_path, dest_path)
+
 def observe_file_system(observers : list[Watcher] = None):
     notify_message("Running Monitor...")
     if observers:
         for observer in observers:
+            if observer._watch:
+                continue
             observer.run()
             print(f"Monitoring '{observer.source_path}'")
 
 """ Ensure Backuped """
 
-def cmp_names(src : str, dst : str) -> bool:
-    return path.basename(src) == path.basename(dst)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+_observers_lock = threading.Lock()
+
+_quick_equal_cache : dict[str, tuple[int, int]] = {}
 
-def try_copy2(src, dst, excludes : list[str], follow_symlinks=True):
+_quick_equal_seed : dict[str, tuple[int, int]] = {}
+
+def _quick_equal(dst : str, src_size : int, src_mtime_ns : int) -> bool:
+    """rsync-style quick check: same size and no newer source means unchanged.
+    Results verified against the destination in this run are memoized;
+    fingerprints seeded from a previous run's manifest get one confirming
+    stat first, so a destination deleted or clobbered between runs is
+    re-copied instead of silently skipped."""
+    fingerprint = (src_size, src_mtime_ns)
+    if _quick_equal_cache.get(dst) == fingerprint:
+        return True
+    seeded = _quick_equal_seed.get(dst) == fingerprint
     try:
-        if path.exists(dst):
-            if cmp_names(src, dst) and filecmp.cmp(src, dst):
-                return
-            else:
-                os.remove(dst)
+        dst_stat = os.stat(dst)
+    except OSError:
+        if seeded:
+            del _quick_equal_seed[dst]
+        return False
+    equal = src_size == dst_stat.st_size and src_mtime_ns <= dst_stat.st_mtime_ns
+    if equal:
+        _quick_equal_cache[dst] = fingerprint
+    elif seeded:
+        del _quick_equal_seed[dst]
+    return equal
+
+MANIFEST_FILE_NAME = "backup.manifest"
+
+def load_copy_manifest(target_root : str):
+    """Seed the quick check with the previous run's fingerprints. Seeded
+    entries are not trusted outright: _quick_equal re-verifies each against
+    the destination once before skipping the copy."""
+    try:
+        with open(os.path.join(target_root, MANIFEST_FILE_NAME), 'rb') as fi:
+            entries = pickle.load(fi)
+    except Exception:
+        return
+    if isinstance(entries, dict):
+        _quick_equal_seed.update(entries)
+
+def store_copy_manifest(target_root : str):
+    prefix = target_root if target_root.endswith(os.sep) else target_root + os.sep
+    entries = {dst: fingerprint for dst, fingerprint in _quick_equal_cache.items()
+               if dst.startswith(prefix)}
+    try:
+        with open(os.path.join(target_root, MANIFEST_FILE_NAME), 'wb') as fo:
+            pickle.dump(entries, fo)
+    except OSError as os_err:
+        raise_warning(f"Can't write the copy manifest under '{target_root}' :: {str(os_err)}", FS_ERROR_CAT)
+
+def try_copy2(src_entry : os.DirEntry, dst : str, follow_symlinks=True):
+    src = src_entry.path
+    src_stat = None
+    try:
+        src_stat = src_entry.stat(follow_symlinks=follow_symlinks)
+        if _quick_equal(dst, src_stat.st_size, src_stat.st_mtime_ns):
+            return
+        try:
+            os.remove(dst)
+        except FileNotFoundError:
+            pass
     except OSError as os_err:
         raise_warning(f"OS error deleting existent file '{dst}' :: {str(os_err)}", COPY_FILES_CAT)
     except Exception as err:
         raise_warning(f"General error comparing source '{src}' and target files '{dst}' :: {str(err)}", COPY_FILES_CAT)
     try:
         copy_method(src, dst)
+        if src_stat:
+            _quick_equal_cache[dst] = (src_stat.st_size, src_stat.st_mtime_ns)
         notify_message(f"Copied '{src}' to '{dst}'")
     except OSError as os_err:
         raise_warning(f"OS error copying files: '{src}' :: {str(os_err)}", COPY_FILES_CAT)
     except Exception as err:
         raise_warning(f"General error copying files: '{src}' :: {str(err)}", COPY_FILES_CAT)
 
+@functools.lru_cache(maxsize=128)
+def _compile_ignore(patterns : tuple[str, ...]) -> Callable[[str, list[str]], set[str]]:
+    rx = re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+    def ignore(folder : str, names : list[str]) -> set[str]:
+        return {name for name in names if rx.match(name)}
+    return ignore
+
+def fast_ignore(patterns : list[str]) -> Callable[[str, list[str]], set[str]] | None:
+    """Like shutil.ignore_patterns, but with all patterns compiled into one regex."""
+    if not patterns:
+        return None
+    # Canonical key: rules listing the same patterns in a different order
+    # share one compiled regex.
+    return _compile_ignore(tuple(sorted(set(patterns))))
+
+def copy_tree(src_dir : str, dst_dir : str, ignore, copy_entry : Callable[[os.DirEntry, str], None],
+              excludes : frozenset[str] = frozenset()):
+    """scandir-based copytree that hands each DirEntry to the copy callback,
+    so its cached stat is reused instead of re-statting every file.
+    The caller guarantees dst_dir's parent exists, so one mkdir suffices
+    where makedirs would walk every ancestor again."""
+    try:
+        os.mkdir(dst_dir)
+    except FileExistsError:
+        pass
+    with os.scandir(src_dir) as it:
+        entries = list(it)
+    ignored = ignore(src_dir, [entry.name for entry in entries]) if ignore else set()
+    for entry in entries:
+        if entry.name in ignored or entry.path in excludes:
+            continue
+        dst = os.path.join(dst_dir, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            copy_tree(entry.path, dst, ignore, copy_entry, excludes)
+        else:
+            copy_entry(entry, dst)
+
 def arrange_ignore_patterns(include : Include) -> list[str]:
-    return [
-            exclude.removeprefix(include_src + os.sep)
-            for exclude in include.excludes 
-            for include_src in include.include_paths 
-            if exclude.startswith(include_src)
-        ]
+    if include._ignore_patterns_cache is not None:
+        return include._ignore_patterns_cache
+    patterns : list[str] = []
+    # Same case-normalized predecessor lookup the validation visitor uses,
+    # with the same full-scan fallback for nested include paths. Slicing by
+    # prefix length is safe because normcase preserves it.
+    sorted_prefixes = sorted(os.path.normcase(prefix)
+                             for prefix in include._include_prefixes)
+    for exclude in include.excludes:
+        exclude_nc = os.path.normcase(exclude)
+        i = bisect.bisect_right(sorted_prefixes, exclude_nc) - 1
+        prefix = sorted_prefixes[i] if i >= 0 and exclude_nc.startswith(sorted_prefixes[i]) else None
+        if prefix is None:
+            for candidate in sorted_prefixes:
+                if exclude_nc.startswith(candidate):
+                    prefix = candidate
+                    break
+        if prefix:
+            patterns.append(exclude[len(prefix):])
+    include._ignore_patterns_cache = patterns
+    return patterns
 
 def backup_single_path(observers : list[Watcher] | None, include : Include, ignore_patterns : list[str], source_path : str):
 
     if not os.path.exists(source_path):
         raise_warning(f"Source path does not exist: '{source_path}'", COPY_FILES_CAT)
         return
-    ignore = shutil.ignore_patterns(*ignore_patterns)
+    ignore = fast_ignore(ignore_patterns)
     source_folder_name = os.path.basename(source_path)
     target_path = path.join(include.target_path, source_folder_name)
 
@@ -670,12 +1181,20 @@ def backup_single_path(observers : list[Watcher] | None, include : Include, igno
                     COPY_FILES_CAT, ERROR)
             return
 
-        shutil.copytree(
-                    source_path, target_path, 
-                    dirs_exist_ok=True, 
-                    ignore=ignore,
-                    copy_function=lambda src, dst: try_copy2(src, dst, include.excludes)
-                    )
+        futures = []
+        submit = _get_copy_pool().submit
+        append = futures.append
+
+        def queue_copy(entry : os.DirEntry, dst : str):
+            append(submit(try_copy2, entry, dst))
+
+        os.makedirs(include.target_path, exist_ok=True)
+        copy_tree(source_path, target_path, ignore, queue_copy,
+                  frozenset(include.excludes))
+        for future in as_completed(futures):
+            err = future.exception()
+            if err:
+                notify_event(str(err), COPY_FILES_CAT, ERROR)
     except OSError as os_err:
         raise_warning(f"OS error happened: '{str(os_err)}' while backuping '{source_path}'", FS_ERROR_CAT)
 
@@ -683,7 +1202,8 @@ def backup_single_path(observers : list[Watcher] | None, include : Include, igno
         if observers != None:
             observer = Watcher(source_path, include.target_path, source_folder_name)
             observer.configure_observer(ignore_patterns)
-            observers.append(observer)
+            with _observers_lock:
+                observers.append(observer)
     except OSError as os_err:
         raise_warning(f"OS error happened: '{str(os_err)}' while attempting to monitor '{source_path}'", FS_ERROR_CAT)
 
@@ -709,22 +1229,58 @@ def has_enough_space(src : str, dst : str) -> bool:
         return False
 
 
+BACKUP_MAX_WORKERS = min(32, 2 * (os.cpu_count() or 1))
+
+_copy_pool : ThreadPoolExecutor | None = None
+_copy_pool_lock = threading.Lock()
+
+def _get_copy_pool() -> ThreadPoolExecutor:
+    """One shared pool for per-file copies, so concurrent backup walks
+    don't multiply thread counts."""
+    global _copy_pool
+    with _copy_pool_lock:
+        if _copy_pool is None:
+            _copy_pool = ThreadPoolExecutor(max_workers=BACKUP_MAX_WORKERS,
+                                            thread_name_prefix='copy')
+        return _copy_pool
+
 def ensure_data_is_backuped(includes: list[Include], observers : list[Watcher] = None):
     """If observers is None, don't monitor the file system"""
-    
+
     print("Initiated backuping...")
+    tasks = []
+    target_roots : set[str] = set()
     for include in includes:
         ignore_patterns = arrange_ignore_patterns(include)
         for source_path in include.include_paths:
             if include.is_active:
-                backup_single_path(observers, include, ignore_patterns, source_path)
+                tasks.append((include, ignore_patterns, source_path))
+                target_roots.add(include.target_path)
+    for target_root in target_roots:
+        load_copy_manifest(target_root)
+    if len(tasks) <= 1:
+        for include, ignore_patterns, source_path in tasks:
+            backup_single_path(observers, include, ignore_patterns, source_path)
+    else:
+        with ThreadPoolExecutor(max_workers=min(BACKUP_MAX_WORKERS, len(tasks))) as pool:
+            futures = [
+                pool.submit(backup_single_path, observers, include, ignore_patterns, source_path)
+                for include, ignore_patterns, source_path in tasks]
+        for future in as_completed(futures):
+            err = future.exception()
+            if err:
+                notify_event(str(err), COPY_FILES_CAT, ERROR)
+    for target_root in target_roots:
+        store_copy_manifest(target_root)
+    # Resolved-path results are only trustworthy while the reconciliation
+    # walk runs; drop them before live monitoring takes over.
+    _stat_exists.cache_clear()
     print("Finished backuping.")
 
 """ Device Monitoring """
 
 import atexit
-import subprocess
-from threading import Thread, Timer
+from threading import Thread
 
 try:
     import win32api, win32con, win32gui
@@ -748,10 +1304,16 @@ class Drive:
 
     def __hash__(self) -> int:
         return self.letter.__hash__()
-    
-    @staticmethod
-    def from_json(values):
-        return Drive(values['deviceid'], values['volumename'], values['drivetype'])
+
+DRIVE_TYPES = {
+    0: 'Unknown',
+    1: 'NoRootDirectory',
+    2: 'Removable',
+    3: 'Fixed',
+    4: 'Network',
+    5: 'CDRom',
+    6: 'RamDisk',
+}
 
 class DeviceListener:
     WM_DEVICECHANGE_EVENTS = {
@@ -769,17 +1331,33 @@ class DeviceListener:
         0xFFFF: ('DBT_USERDEFINED', 'The meaning of this message is user-defined.'),
     }
 
+    DEBOUNCE_INTERVAL = 0.2
+
     on_drives_changed_handler : Callable[[], None]
+    _pending : threading.Timer | None
+    _pending_lock : threading.Lock
 
     def __init__(self, drivesChangedCallback : Callable[[], None]) -> None:
         self.on_drives_changed_handler = drivesChangedCallback
+        self._pending = None
+        self._pending_lock = threading.Lock()
+
+    def _fire(self):
+        with self._pending_lock:
+            self._pending = None
+        self.on_drives_changed_handler()
 
     def _on_message(self, hwnd : int, msg : int, wparam : int, lparam : int):
         if msg != win32con.WM_DEVICECHANGE:
             return 0
         event, description = self.WM_DEVICECHANGE_EVENTS[wparam]
         if event in ('DBT_DEVNODES_CHANGED', 'DBT_DEVICEREMOVECOMPLETE', 'DBT_DEVICEARRIVAL'):
-            self.on_drives_changed_handler()
+            # Plugging a hub fires a burst of these; coalesce to one handler call.
+            with self._pending_lock:
+                if self._pending is None:
+                    self._pending = threading.Timer(self.DEBOUNCE_INTERVAL, self._fire)
+                    self._pending.daemon = True
+                    self._pending.start()
         return 0
     
     def _create_window(self):
@@ -812,7 +1390,7 @@ class DevicesWatcher:
 
     def devices_changed(self):
         active_drives_visitor = ConfigurationUpdateActiveDrivesVisitor()
-        self._configuration.accept(active_drives_visitor)
+        active_drives_visitor.update(self._configuration.includes)
         if self._on_activate and len(active_drives_visitor.activated_rules):
             self._on_activate(active_drives_visitor.activated_rules)
         if self._on_deactivate and len(active_drives_visitor.deactivated_rules):
@@ -820,23 +1398,21 @@ class DevicesWatcher:
 
     @staticmethod
     def list_drives() -> list[Drive] | None:
-        proc = subprocess.run(args=[
-                'powershell',
-                '-noprofile',
-                '-command',
-                'Get-WmiObject -Class Win32_LogicalDisk | Select-Object deviceid,volumename,drivetype | ConvertTo-Json'
-            ],
-            text=True,
-            stdout=subprocess.PIPE)
-        if proc.returncode != 0 or not proc.stdout.strip():
+        buffer = ctypes.create_unicode_buffer(256)
+        length = _kernel32.GetLogicalDriveStringsW(len(buffer), buffer)
+        if not length:
             return None
-        drives = json.loads(proc.stdout)
-        if type(drives).__name__ == 'dict':
-            return [Drive.from_json(drives)]
-        elif type(drives).__name__ == 'list': 
-            return [Drive.from_json(drive) for drive in drives]
-        else:
-            raise Exception()
+        drives : list[Drive] = []
+        for root in buffer[:length].split('\x00'):
+            if not root:
+                continue
+            drive_type = _kernel32.GetDriveTypeW(root)
+            label_buffer = ctypes.create_unicode_buffer(261)
+            _kernel32.GetVolumeInformationW(root, label_buffer, len(label_buffer),
+                                            None, None, None, None, 0)
+            drives.append(Drive(root.rstrip(os.sep), label_buffer.value,
+                                DRIVE_TYPES.get(drive_type, str(drive_type))))
+        return drives
 
 def activate_rules(includes : list[Include], watchers : list[Watcher]):
     """New includes that were activated; working observers"""
@@ -886,9 +1462,10 @@ def main():
 
         global log_file
         try:
-            log_file = open(os.path.join(CURRENT_DIR, "events.log"), "wb")
+            log_file = open(os.path.join(CURRENT_DIR, "events.log"), "wb", buffering=LOG_BUFFER_SIZE)
         except IOError:
             log_file = NoLog()
+        start_log_flusher()
 
         notify_message('Started from: ' + CURRENT_DIR)
 
@@ -896,20 +1473,18 @@ def main():
         try_create_shortcut(CURRENT_PATH)
 
         config = try_read_config(CURRENT_DIR)
-        config.accept(ConfigurationValidationVisitor())
         active_drives_visitor = ConfigurationUpdateActiveDrivesVisitor()
-        config.accept(active_drives_visitor)
+        config.accept(CompositeVisitor([ConfigurationValidationVisitor(), active_drives_visitor]))
 
         watchers = []
         ensure_data_is_backuped(config.includes, watchers)
         observe_file_system(watchers)
         run_device_watcher(config, watchers)
 
-        try:
-            while True:
-                input()
-        except KeyboardInterrupt:
-            print(APPLICATION_NAME + " monitoring is interrupted")
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda *args: stop_event.set())
+        stop_event.wait()
+        print(APPLICATION_NAME + " monitoring is interrupted")
 
     except Exception as any_error:
         notify_message(any_error)
@@ -919,7 +1494,9 @@ def main():
 
 def on_exit_handler():
     print('<exited>')
-    log_file.close()
+    _log_queue_settle()
+    with _log_lock:
+        log_file.close()
 
 if __name__ == "__main__":
     atexit.register(on_exit_handler)